@@ -6,15 +6,27 @@ Optimized for lower resource consumption
 """
 
 import time
+import ctypes
 import psutil
-import subprocess
 import os
 import glob
+import heapq
+import threading
+import traceback
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 from luma.core.interface.serial import i2c
 from luma.core.render import canvas
 from luma.oled.device import ssd1306
+from smbus2 import SMBus, i2c_msg
+
+# Fixed 128x64 panel geometry
+WIDTH = 128
+HEIGHT = 64
+NOTIF_H = 16     # Notification bar rows (pages 0-1)
+GIF_W = 64
+GIF_H = 48
+PANEL_X = 66     # Left edge of the info panel text
 
 class OptimizedServerMonitor:
     def __init__(self, i2c_port=1, i2c_address=0x3C, gif_directory="./gifs"):
@@ -22,8 +34,50 @@ class OptimizedServerMonitor:
         print("🎮 Initializing Optimized Server Monitor...")
         
         # Initialize I2C and OLED display
-        serial = i2c(port=i2c_port, address=i2c_address)
-        self.device = ssd1306(serial, width=128, height=64)
+        # Own the SMBus handle so region bursts can go through i2c_rdwr directly
+        self.i2c_bus = SMBus(i2c_port)
+        serial = i2c(bus=self.i2c_bus, address=i2c_address)
+        self.device = ssd1306(serial, width=WIDTH, height=HEIGHT)
+        self.i2c_address = i2c_address
+        
+        # Backbuffer the text regions are rendered into
+        self.image = Image.new('1', (WIDTH, HEIGHT), 0)
+        self.draw = ImageDraw.Draw(self.image)
+        self.last_rendered_stats = None
+        
+        # Screen regions as (first column, last column, first page, last page);
+        # only regions flagged dirty are sent to the panel
+        self.regions = {
+            'notif': (0, WIDTH - 1, 0, NOTIF_H // 8 - 1),
+            'gif': (0, GIF_W - 1, NOTIF_H // 8, HEIGHT // 8 - 1),
+            'info': (GIF_W, WIDTH - 1, NOTIF_H // 8, HEIGHT // 8 - 1),
+        }
+        self._dirty = {'notif': True, 'gif': True, 'info': True}
+        
+        # Latest SSD1306 page bytes of every region, already in the order its
+        # column/page window expects, so flushing needs no copy or blit
+        self.region_data = {
+            name: bytes((col_end - col_start + 1) * (page_end - page_start + 1))
+            for name, (col_start, col_end, page_start, page_end) in self.regions.items()
+        }
+        
+        # One preallocated I2C message per region: byte 0 is the 0x40 data
+        # control byte and the payload view is refilled in place by one memcpy
+        self.region_msgs = {}
+        for name, data in self.region_data.items():
+            buffer = (ctypes.c_ubyte * (len(data) + 1))(0x40)
+            msg = i2c_msg(addr=self.i2c_address, flags=0, len=len(buffer),
+                          buf=ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+            self.region_msgs[name] = (msg, memoryview(buffer).cast('B')[1:])
+        
+        # Stats are collected on one thread and frames composed on another;
+        # the main thread only flushes dirty regions over I2C
+        self.stats_lock = threading.Lock()
+        self.frame_lock = threading.Lock()
+        self.frame_ready = threading.Event()
+        self.stats_ready = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread_error = None
         
         # Configuration for performance tuning
         self.update_intervals = {
@@ -35,23 +89,42 @@ class OptimizedServerMonitor:
         
         # GIF Animation System - Dynamic based on usage
         self.gif_directory = gif_directory
+        # Each set is one contiguous bytes object of packed 64x48 frames
+        self.frame_bytes = GIF_W * GIF_H // 8
         self.gif_sets = {
-            'low': [],
-            'medium': [],
-            'high': []
+            'low': b'',
+            'medium': b'',
+            'high': b''
         }
         self.current_usage_level = 'low'
         self.current_frame = 0
-        self.last_frame_time = 0
         
         # Information rotation system
         self.info_pages = ['system', 'storage', 'network', 'processes']
+        self.info_titles = {'system': 'SYS', 'storage': 'DISK', 'network': 'NET', 'processes': 'PROC'}
         self.current_info_page = 0
-        self.page_change_time = time.time()
+        
+        # Monotonic deadlines of the render thread's periodic tasks
+        self._next = {
+            'gif': 0,
+            'page': time.monotonic() + self.update_intervals['page_rotate'],
+        }
+        
+        # Pseudo-files kept open and re-read from offset 0 with pread
+        self.temp_fd = self.open_pseudo_file('/sys/class/thermal/thermal_zone0/temp')
+        self.net_dev_fd = self.open_pseudo_file('/proc/net/dev')
+        self.cpu_stat_fd = self.open_pseudo_file('/proc/stat')
+        self.loadavg_fd = self.open_pseudo_file('/proc/loadavg')
+        
+        # CPU time tracking as (total jiffies, idle jiffies, monotonic time);
+        # primed here so the first published sample covers a real window
+        self.prev_cpu_times = None
+        self.last_cpu_percent = 0.0
+        self.read_cpu_percent()
         
         # Network speed tracking
-        self.prev_net_io = psutil.net_io_counters()
-        self.prev_net_time = time.time()
+        self.prev_net_bytes = self.read_net_bytes()
+        self.prev_net_time = time.monotonic()
         self.net_up_speed = 0.0
         self.net_down_speed = 0.0
         
@@ -59,9 +132,40 @@ class OptimizedServerMonitor:
         self.cached_stats = None
         self.last_stats_update = 0
         
+        # Display strings as key -> (rounding digits, formatter); the cache
+        # keeps (rounded value, text) so strings are only rebuilt on change.
+        # Speeds use None: format_speed picks its own precision per range, so
+        # they are keyed on the raw value to avoid rounding twice
+        self._formats = {
+            'cpu': (1, "CPU {:4.1f}%".format),
+            'ram': (1, "RAM {:4.1f}%".format),
+            'net': (None, lambda speed: "NET " + self.format_speed(speed)),
+            'temp': (0, "T:{:2.0f}°C".format),
+            'load': (2, "L:{:4.2f}".format),
+            'procs': (0, "P:{}".format),
+            'disk_used': (0, "U:{:2.0f}%".format),
+            'disk_free': (1, "F:{:2.1f}G".format),
+            'net_up': (None, lambda speed: "U:" + self.format_speed(speed)),
+            'net_down': (None, lambda speed: "D:" + self.format_speed(speed)),
+        }
+        self._fmt_cache = {}
+        self._width_cache = {}
+        
+        # Pre-rendered disk usage bars keyed by integer percentage
+        self._disk_bar_cache = {}
+        
+        # Per-process CPU tick snapshot for the /proc based top processes list
+        self.prev_proc_ticks = {}
+        self.prev_proc_time = time.monotonic()
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.cpu_count = os.cpu_count() or 1
+        
         # Load fonts
         self.load_fonts()
         
+        # Render the static parts of the info pages once
+        self.build_page_templates()
+        
         # Load all GIF sets
         self.load_all_gifs()
         
@@ -81,6 +185,51 @@ class OptimizedServerMonitor:
             self.small_font = self.font
             self.tiny_font = self.font
             self.notification_font = self.font
+        
+        # Pre-render the characters the panels use into 1-bit glyph tiles so
+        # the hot path composes text by pasting instead of rasterizing
+        self.glyph_fonts = {
+            'notification': self.notification_font,
+            'small': self.small_font,
+            'tiny': self.tiny_font,
+        }
+        self.glyphs = {}
+        for size in self.glyph_fonts:
+            for char in "0123456789.%/:°CPURAMNETSYSDISKPROCKMGUDLTF ":
+                self.get_glyph(size, char)
+
+    def get_glyph(self, size, char):
+        """Return the cached (tile, x offset, y offset, advance) of a character"""
+        glyph = self.glyphs.get((size, char))
+        if glyph is None:
+            # Characters outside the pre-rendered set (process names) are added lazily
+            font = self.glyph_fonts[size]
+            left, top, right, bottom = font.getbbox(char)
+            tile = None
+            if right > left and bottom > top:
+                tile = Image.new('1', (right - left, bottom - top), 0)
+                ImageDraw.Draw(tile).text((-left, -top), char, font=font, fill=1)
+            glyph = (tile, left, top, font.getlength(char))
+            self.glyphs[(size, char)] = glyph
+        return glyph
+
+    def text_width(self, text, size):
+        """Width of a string when composed from the glyph atlas"""
+        width = self._width_cache.get((size, text))
+        if width is None:
+            width = sum(self.get_glyph(size, char)[3] for char in text)
+            self._width_cache[(size, text)] = width
+        return width
+
+    def _blit_text(self, image, text, x, y, size, fill=1):
+        """Compose a string by pasting atlas glyphs, using each tile as its own mask"""
+        get_glyph = self.get_glyph
+        paste = image.paste
+        for char in text:
+            tile, left, top, advance = get_glyph(size, char)
+            if tile is not None:
+                paste(fill, (int(x + left), y + top), tile)
+            x += advance
 
     def load_all_gifs(self):
         """Load GIFs for all usage levels with optimization"""
@@ -95,7 +244,8 @@ class OptimizedServerMonitor:
                 print(f"📂 Creating default {level} animation...")
                 self.gif_sets[level] = self.create_default_animation(level)
         
-        print(f"✨ Loaded GIFs: Low({len(self.gif_sets['low'])}), Medium({len(self.gif_sets['medium'])}), High({len(self.gif_sets['high'])})")
+        counts = {level: len(frames) // self.frame_bytes for level, frames in self.gif_sets.items()}
+        print(f"✨ Loaded GIFs: Low({counts['low']}), Medium({counts['medium']}), High({counts['high']})")
 
     def load_gif_frames(self, gif_path):
         """Optimized GIF loading with pre-processing"""
@@ -104,7 +254,12 @@ class OptimizedServerMonitor:
         try:
             with Image.open(gif_path) as gif:
                 # Get frame duration first
-                frame_duration = gif.info.get('duration', 100) / 1000.0
+                # Delays of 0-10 ms mean "as fast as possible"; like browsers,
+                # play those at 100 ms so the render thread never spins
+                duration_ms = gif.info.get('duration', 100) or 0
+                if duration_ms <= 10:
+                    duration_ms = 100
+                frame_duration = max(duration_ms / 1000.0, 0.02)
                 self.update_intervals['gif_frame'] = frame_duration
                 
                 # Process all frames
@@ -113,20 +268,21 @@ class OptimizedServerMonitor:
                         gif.seek(frame_num)
                         frame = gif.copy()
                         
-                        # Resize and convert to monochrome
-                        frame = frame.resize((64, 48), Image.Resampling.LANCZOS)
+                        # Resize and convert to monochrome; the hard 1-bit threshold
+                        # discards anything finer than a bilinear filter gives
                         frame = frame.convert('L')
-                        frame = frame.point(lambda x: 255 if x > 128 else 0, mode='1')
+                        frame = frame.resize((GIF_W, GIF_H), Image.Resampling.BILINEAR)
+                        frame = frame.convert('1', dither=Image.Dither.NONE)
                         
-                        frames.append(frame)
+                        frames.append(self.pack_pages(frame))
                     except EOFError:
                         break
                 
         except Exception as e:
             print(f"❌ Error loading {gif_path}: {e}")
-            frames = self.create_error_animation()
+            return self.create_error_animation()
         
-        return frames
+        return b''.join(frames)
 
     def create_default_animation(self, level):
         """Create simple default animation with minimal resources"""
@@ -139,37 +295,96 @@ class OptimizedServerMonitor:
         
         # Create just 4 frames for default animation
         for i in range(4):
-            frame = Image.new('1', (64, 48), 0)
+            frame = Image.new('1', (GIF_W, GIF_H), 0)
             draw = ImageDraw.Draw(frame)
             
             if pattern[level][i]:
                 draw.rectangle([20, 10, 44, 34], fill=1)
             
             draw.text((15, 36), level.upper()[:4], font=self.small_font, fill=1)
-            frames.append(frame)
+            frames.append(self.pack_pages(frame))
         
-        return frames
+        return b''.join(frames)
 
     def create_error_animation(self):
         """Simple error display"""
-        frame = Image.new('1', (64, 48), 0)
+        frame = Image.new('1', (GIF_W, GIF_H), 0)
         draw = ImageDraw.Draw(frame)
         draw.text((10, 18), "ERR", font=self.small_font, fill=1)
-        return [frame]
+        return self.pack_pages(frame)
 
-    def get_system_stats(self):
-        """Get system statistics with caching to reduce CPU load"""
-        current_time = time.time()
+    def pack_pages(self, image):
+        """Pack a 1-bit image into SSD1306 page layout (one byte = 8 vertical pixels)"""
+        # Transposing turns every column into a row, and '1;R' packs each row
+        # LSB-first, so each byte holds 8 vertical pixels of one page
+        pages = image.height // 8
+        raw = image.transpose(Image.Transpose.TRANSPOSE).tobytes('raw', '1;R')
+        return b''.join(raw[page::pages] for page in range(pages))
+
+    def open_pseudo_file(self, path):
+        """Open a /proc or /sys file for repeated pread calls, or None if unavailable"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    def read_cpu_percent(self):
+        """System-wide CPU usage since the previous call, from the first /proc/stat line"""
+        now = time.monotonic()
+        if self.prev_cpu_times is not None and now - self.prev_cpu_times[2] < 0.1:
+            # Too short a window for meaningful jiffy deltas; keep the last sample
+            return self.last_cpu_percent
         
-        # Return cached stats if not expired
-        if (self.cached_stats and 
-            current_time - self.last_stats_update < self.update_intervals['stats']):
-            return self.cached_stats
+        try:
+            # "cpu  user nice system idle iowait irq softirq steal guest guest_nice";
+            # guest time is already counted in user/nice
+            line = os.pread(self.cpu_stat_fd, 256, 0).split(b'\n', 1)[0]
+            times = [int(field) for field in line.split()[1:9]]
+        except:
+            return 0.0
+        
+        total = sum(times)
+        idle = times[3] + times[4]
+        prev_times = self.prev_cpu_times
+        self.prev_cpu_times = (total, idle, now)
+        if prev_times is None or total <= prev_times[0]:
+            return self.last_cpu_percent
         
+        self.last_cpu_percent = (1 - (idle - prev_times[1]) / (total - prev_times[0])) * 100
+        return self.last_cpu_percent
+
+    def read_net_bytes(self):
+        """Total (sent, received) bytes across all non-loopback interfaces"""
+        sent = recv = 0
+        try:
+            data = os.pread(self.net_dev_fd, 16384, 0)
+        except:
+            return sent, recv
+        
+        # Two header lines, then "iface: rx_bytes ... (8 rx fields) tx_bytes ..."
+        for line in data.split(b'\n')[2:]:
+            name, _, counters = line.partition(b':')
+            fields = counters.split()
+            if not fields or name.strip() == b'lo':
+                continue
+            recv += int(fields[0])
+            sent += int(fields[8])
+        return sent, recv
+
+    def get_system_stats(self):
+        """Get the latest stats snapshot published by the stats thread"""
+        with self.stats_lock:
+            return self.cached_stats, self.last_stats_update
+
+    def update_system_stats(self):
+        """Collect fresh system statistics and publish them as the cached snapshot"""
+        current_time = time.time()
+        page = self.info_pages[self.current_info_page]
         stats = {}
         
-        # CPU stats
-        stats['cpu_percent'] = psutil.cpu_percent(interval=0.1)
+        # CPU and memory feed the notification bar, so they are always read
+        # CPU stats (non-blocking: measured since the previous call)
+        stats['cpu_percent'] = self.read_cpu_percent()
         
         # Memory stats
         memory = psutil.virtual_memory()
@@ -177,24 +392,28 @@ class OptimizedServerMonitor:
         stats['memory_used_gb'] = memory.used / (1024**3)
         stats['memory_total_gb'] = memory.total / (1024**3)
         
-        # Disk stats (cache these as they change slowly)
-        if not hasattr(self, 'disk_total_gb') or current_time - self.last_stats_update > 30:
+        # Disk stats (change slowly, only refreshed while the storage page is shown)
+        if not hasattr(self, 'disk_total_gb') or (
+                page == 'storage' and current_time - self.disk_update_time > 30):
             disk = psutil.disk_usage('/')
             self.disk_total_gb = disk.total / (1024**3)
             self.disk_free_gb = disk.free / (1024**3)
             self.disk_percent = (disk.used / disk.total) * 100
+            self.disk_update_time = current_time
         
         stats['disk_percent'] = self.disk_percent
         stats['disk_free_gb'] = self.disk_free_gb
         stats['disk_total_gb'] = self.disk_total_gb
         
-        # Temperature (Raspberry Pi) - read less frequently
-        if not hasattr(self, 'cpu_temp') or current_time - self.last_stats_update > 5:
+        # Temperature (Raspberry Pi) - read less frequently, system page only
+        if not hasattr(self, 'cpu_temp') or (
+                page == 'system' and current_time - self.temp_update_time > 5):
             try:
-                temp_output = subprocess.check_output(['vcgencmd', 'measure_temp'], timeout=1).decode()
-                self.cpu_temp = float(temp_output.split('=')[1].split('°')[0])
+                # Millidegrees Celsius as a plain integer
+                self.cpu_temp = int(os.pread(self.temp_fd, 16, 0)) / 1000.0
             except:
                 self.cpu_temp = 0
+            self.temp_update_time = current_time
         
         stats['cpu_temp'] = self.cpu_temp
         
@@ -203,66 +422,138 @@ class OptimizedServerMonitor:
         stats['net_up_speed'] = self.net_up_speed
         stats['net_down_speed'] = self.net_down_speed
         
-        # System load
-        try:
-            stats['load_avg'] = os.getloadavg()[0]
-        except:
-            stats['load_avg'] = 0
-        
-        # Process count (cache this as it changes slowly)
-        if not hasattr(self, 'process_count') or current_time - self.last_stats_update > 10:
-            self.process_count = len(psutil.pids())
+        # System load and process count, system page only
+        if not hasattr(self, 'load_avg') or page == 'system':
+            try:
+                # "<1 min> <5 min> <15 min> <running>/<total> <last pid>"
+                self.load_avg = float(os.pread(self.loadavg_fd, 128, 0).split(None, 1)[0])
+            except:
+                self.load_avg = 0
+            
+            # The loadavg total counts threads, so count the PID directories instead
+            try:
+                with os.scandir('/proc') as entries:
+                    self.process_count = sum(1 for entry in entries if entry.name.isdigit())
+            except OSError:
+                self.process_count = 0
         
+        stats['load_avg'] = self.load_avg
         stats['process_count'] = self.process_count
         
         # Top processes (only update when needed)
-        if self.info_pages[self.current_info_page] == 'processes':
+        if page == 'processes':
             stats['top_processes'] = self.get_top_processes()
         else:
             stats['top_processes'] = []
         
-        # Cache the results
-        self.cached_stats = stats
-        self.last_stats_update = current_time
+        # Publish the results
+        with self.stats_lock:
+            self.cached_stats = stats
+            self.last_stats_update = current_time
         
         return stats
 
+    def run_guarded(self, loop):
+        """Run a background loop; a crash stops the whole monitor instead of just the thread"""
+        try:
+            loop()
+        except Exception as e:
+            traceback.print_exc()
+            self.thread_error = e
+            self.stop_event.set()
+            # Wake every sleeper so run() notices and exits
+            self.stats_ready.set()
+            self.frame_ready.set()
+
+    def stats_loop(self):
+        """Background thread: poll system stats at the stats interval"""
+        due = time.monotonic() + self.update_intervals['stats']
+        while not self.stop_event.wait(max(0, due - time.monotonic())):
+            self.update_system_stats()
+            self.stats_ready.set()
+            due += self.update_intervals['stats']
+
     def get_top_processes(self):
-        """Get top 3 processes by CPU usage - optimized with timeout"""
+        """Get top 3 processes by CPU usage from a direct /proc walk"""
+        current_time = time.monotonic()
+        elapsed = current_time - self.prev_proc_time
+        ticks = {}
         processes = []
         try:
-            # Use a short timeout to prevent hanging
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f"/proc/{entry.name}/stat", 'rb') as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    
+                    # comm may contain spaces, so split after its closing paren;
+                    # utime/stime (fields 14/15) are then at offsets 11/12
+                    head, _, rest = data.rpartition(b')')
+                    fields = rest.split()
+                    pid = int(entry.name)
+                    total = int(fields[11]) + int(fields[12])
+                    ticks[pid] = total
+                    
+                    delta = total - self.prev_proc_ticks.get(pid, total)
+                    if delta > 0:
+                        processes.append((delta, pid, head[head.index(b'(') + 1:]))
+        except OSError:
+            # No readable /proc (e.g. not Linux)
+            return self.get_top_processes_psutil()
+        except:
+            return []
+        
+        self.prev_proc_ticks = ticks
+        self.prev_proc_time = current_time
+        if elapsed <= 0:
+            return []
+        
+        # Ticks -> percent of the whole machine over the sampling window
+        scale = 100.0 / (self.clock_ticks * elapsed * self.cpu_count)
+        return [{'pid': pid, 'name': name.decode(errors='replace'), 'cpu_percent': delta * scale}
+                for delta, pid, name in heapq.nlargest(3, processes)]
+
+    def get_top_processes_psutil(self):
+        """Fallback top 3 processes through psutil, one cached read per process"""
+        def samples():
+            for proc in psutil.process_iter():
                 try:
-                    if proc.info['cpu_percent'] and proc.info['cpu_percent'] > 0:
-                        processes.append(proc.info)
-                        # Limit to 10 processes for sorting to save resources
-                        if len(processes) >= 10:
-                            break
+                    # oneshot() shares the /proc/<pid> reads between attributes
+                    with proc.oneshot():
+                        info = proc.as_dict(attrs=['pid', 'name', 'cpu_percent'])
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            
-            # Sort by CPU usage and return top 3
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            return processes[:3]
+                    continue
+                if info['cpu_percent']:
+                    # psutil reports per-core percent; match the /proc walk
+                    info['cpu_percent'] /= self.cpu_count
+                    yield info
+        
+        try:
+            return heapq.nlargest(3, samples(), key=lambda info: info['cpu_percent'])
         except:
             return []
 
     def update_network_speeds(self):
         """Calculate real-time network speeds with interval checking"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
-        if current_time - self.prev_net_time >= self.update_intervals['network']:
-            current_net = psutil.net_io_counters()
+        # stats_loop already paces the calls, so allow slack for ticks that
+        # land a hair early; time_diff keeps the rate exact either way
+        if current_time - self.prev_net_time >= 0.5 * self.update_intervals['network']:
+            current_net = self.read_net_bytes()
             time_diff = current_time - self.prev_net_time
             
-            bytes_sent_diff = current_net.bytes_sent - self.prev_net_io.bytes_sent
-            bytes_recv_diff = current_net.bytes_recv - self.prev_net_io.bytes_recv
+            bytes_sent_diff = current_net[0] - self.prev_net_bytes[0]
+            bytes_recv_diff = current_net[1] - self.prev_net_bytes[1]
             
             self.net_up_speed = (bytes_sent_diff / time_diff) / 1024  # KB/s
             self.net_down_speed = (bytes_recv_diff / time_diff) / 1024  # KB/s
             
-            self.prev_net_io = current_net
+            self.prev_net_bytes = current_net
             self.prev_net_time = current_time
 
     def determine_usage_level(self, stats):
@@ -283,161 +574,255 @@ class OptimizedServerMonitor:
 
     def format_speed(self, speed_kb):
         """Format network speed for display"""
-        if speed_kb >= 1024:
-            return f"{speed_kb/1024:.1f}M"
-        elif speed_kb >= 10:
+        # Idle links are the common case, so test the small ranges first
+        if speed_kb < 10:
+            return f"{speed_kb:.1f}K"
+        elif speed_kb < 1024:
             return f"{speed_kb:.0f}K"
         else:
-            return f"{speed_kb:.1f}K"
+            return f"{speed_kb/1024:.1f}M"
+
+    def format_stat(self, key, value):
+        """Return the display string for a stat, rebuilt only when its shown value changes"""
+        digits, formatter = self._formats[key]
+        rounded = value if digits is None else round(value, digits)
+        cached = self._fmt_cache.get(key)
+        if cached is None or cached[0] != rounded:
+            cached = (rounded, formatter(rounded))
+            self._fmt_cache[key] = cached
+        return cached[1]
 
     def draw_notification_bar(self, draw, stats):
         """Draw notification bar with CPU, RAM, Network"""
+        # Bind hot lookups to locals
+        blit = self._blit_text
+        fmt = self.format_stat
+        image = self.image
+        line = draw.line
+        
         # Background
-        draw.rectangle([(0, 0), (127, 14)], fill=1, outline=1)
+        draw.rectangle([(0, 0), (WIDTH - 1, NOTIF_H - 2)], fill=1, outline=1)
         
         # CPU Section
-        cpu_text = f"CPU {stats['cpu_percent']:4.1f}%"
-        draw.text((2, 2), cpu_text, font=self.notification_font, fill=0)
+        cpu_text = fmt('cpu', stats['cpu_percent'])
+        blit(image, cpu_text, 2, 2, 'notification', fill=0)
         
         # RAM Section
-        ram_text = f"RAM {stats['memory_percent']:4.1f}%"
-        draw.text((44, 2), ram_text, font=self.notification_font, fill=0)
+        ram_text = fmt('ram', stats['memory_percent'])
+        blit(image, ram_text, 44, 2, 'notification', fill=0)
         
         # Network Section
-        net_text = f"NET {self.format_speed(stats['net_up_speed'] + stats['net_down_speed'])}"
-        bbox = draw.textbbox((0, 0), net_text, font=self.notification_font)
-        text_width = bbox[2] - bbox[0]
-        draw.text((126 - text_width, 2), net_text, font=self.notification_font, fill=0)
+        net_text = fmt('net', stats['net_up_speed'] + stats['net_down_speed'])
+        text_width = self.text_width(net_text, 'notification')
+        blit(image, net_text, WIDTH - 2 - text_width, 2, 'notification', fill=0)
         
         # Separators
-        draw.line([(42, 1), (42, 13)], fill=0, width=1)
-        draw.line([(85, 1), (85, 13)], fill=0, width=1)
+        line([(42, 1), (42, NOTIF_H - 3)], fill=0, width=1)
+        line([(85, 1), (85, NOTIF_H - 3)], fill=0, width=1)
 
-    def draw_dynamic_gif(self, draw, stats):
+    def draw_dynamic_gif(self, stats, fresh_stats, now):
         """Draw the appropriate GIF based on current usage level"""
-        # Update usage level with less frequent checks
-        current_time = time.time()
-        if current_time - self.last_stats_update >= self.update_intervals['stats']:
+        # Update usage level only when new stats arrived
+        if fresh_stats:
             new_level = self.determine_usage_level(stats)
             if new_level != self.current_usage_level:
                 self.current_usage_level = new_level
                 self.current_frame = 0
+                self._dirty['gif'] = True
         
         # Get current GIF set
         current_gif_set = self.gif_sets[self.current_usage_level]
+        frame_count = len(current_gif_set) // self.frame_bytes
         
-        if not current_gif_set:
+        if not frame_count:
             return
         
         # Update frame timing
-        if current_time - self.last_frame_time >= self.update_intervals['gif_frame']:
-            self.current_frame = (self.current_frame + 1) % len(current_gif_set)
-            self.last_frame_time = current_time
-        
-        # Draw current frame on left side
-        frame = current_gif_set[self.current_frame]
-        for y in range(48):
-            for x in range(64):
-                if frame.getpixel((x, y)):
-                    draw.point((x, y + 15), fill=1)
+        if now >= self._next['gif']:
+            self.current_frame = (self.current_frame + 1) % frame_count
+            self._next['gif'] = now + self.update_intervals['gif_frame']
+            self._dirty['gif'] = True
+        
+        # The pre-packed frame already matches the GIF window layout, so a
+        # zero-copy view into the set is all the flush needs
+        offset = self.current_frame * self.frame_bytes
+        self.region_data['gif'] = memoryview(current_gif_set)[offset:offset + self.frame_bytes]
+
+    def rotate_info_page(self, now):
+        """Advance to the next info page once its deadline has passed"""
+        if now >= self._next['page']:
+            self.current_info_page = (self.current_info_page + 1) % len(self.info_pages)
+            self._next['page'] = now + self.update_intervals['page_rotate']
+            return True
+        return False
+
+    def build_page_templates(self):
+        """Pre-render the static layer (border, title, page indicator) of every info page"""
+        box = self.region_box('info')
+        self.page_templates = []
+        for index, page in enumerate(self.info_pages):
+            self.draw.rectangle([box[:2], (box[2] - 1, box[3] - 1)], fill=0)
+            
+            # Draw border for info panel
+            self.draw.line([(GIF_W, NOTIF_H), (GIF_W, HEIGHT - 1)], fill=1, width=1)
+            self._blit_text(self.image, self.info_titles[page], PANEL_X, NOTIF_H + 2, 'small')
+            
+            # Page indicator at bottom right
+            page_text = f"{index + 1}/{len(self.info_pages)}"
+            self._blit_text(self.image, page_text, 115, 55, 'tiny')
+            
+            self.page_templates.append(self.image.crop(box))
 
     def draw_info_panel(self, draw, stats):
         """Draw rotating information panel on right side"""
-        # Check if it's time to rotate pages
-        current_time = time.time()
-        if current_time - self.page_change_time >= self.update_intervals['page_rotate']:
-            self.current_info_page = (self.current_info_page + 1) % len(self.info_pages)
-            self.page_change_time = current_time
-        
-        # Draw border for info panel
-        draw.line([(64, 15), (64, 63)], fill=1, width=1)
+        # Static layer first, then only the live values on top
+        self.image.paste(self.page_templates[self.current_info_page], self.region_box('info')[:2])
         
         # Draw current info page
-        if self.info_pages[self.current_info_page] == 'system':
+        page = self.info_pages[self.current_info_page]
+        if page == 'system':
             self.draw_system_info(draw, stats)
-        elif self.info_pages[self.current_info_page] == 'storage':
+        elif page == 'storage':
             self.draw_storage_info(draw, stats)
-        elif self.info_pages[self.current_info_page] == 'network':
+        elif page == 'network':
             self.draw_network_info(draw, stats)
-        elif self.info_pages[self.current_info_page] == 'processes':
+        elif page == 'processes':
             self.draw_processes_info(draw, stats)
-        
-        # Page indicator at bottom right
-        page_text = f"{self.current_info_page + 1}/{len(self.info_pages)}"
-        draw.text((115, 55), page_text, font=self.tiny_font, fill=1)
 
     def draw_system_info(self, draw, stats):
         """Draw system information"""
-        y = 18
-        
-        draw.text((66, y), "SYS", font=self.small_font, fill=1)
-        y += 10
+        blit = self._blit_text
+        fmt = self.format_stat
+        image = self.image
+        y = NOTIF_H + 12  # Below the title from the page template
         
-        draw.text((66, y), f"T:{stats['cpu_temp']:2.0f}°C", font=self.tiny_font, fill=1)
+        blit(image, fmt('temp', stats['cpu_temp']), PANEL_X, y, 'tiny')
         y += 8
         
-        draw.text((66, y), f"L:{stats['load_avg']:4.2f}", font=self.tiny_font, fill=1)
+        blit(image, fmt('load', stats['load_avg']), PANEL_X, y, 'tiny')
         y += 8
         
-        draw.text((66, y), f"P:{stats['process_count']}", font=self.tiny_font, fill=1)
+        blit(image, fmt('procs', stats['process_count']), PANEL_X, y, 'tiny')
 
     def draw_storage_info(self, draw, stats):
         """Draw storage information"""
-        y = 18
-        
-        draw.text((66, y), "DISK", font=self.small_font, fill=1)
-        y += 10
+        blit = self._blit_text
+        fmt = self.format_stat
+        image = self.image
+        y = NOTIF_H + 12  # Below the title from the page template
         
-        draw.text((66, y), f"U:{stats['disk_percent']:2.0f}%", font=self.tiny_font, fill=1)
+        blit(image, fmt('disk_used', stats['disk_percent']), PANEL_X, y, 'tiny')
         y += 8
         
         # Progress bar for disk usage
-        bar_width = int((stats['disk_percent'] / 100) * 40)
-        draw.rectangle([(66, y), (66 + bar_width, y + 4)], fill=1)
-        draw.rectangle([(66, y), (106, y + 4)], outline=1)
+        image.paste(self.get_disk_bar(stats['disk_percent']), (PANEL_X, y))
         y += 8
         
-        draw.text((66, y), f"F:{stats['disk_free_gb']:2.1f}G", font=self.tiny_font, fill=1)
+        blit(image, fmt('disk_free', stats['disk_free_gb']), PANEL_X, y, 'tiny')
+
+    def get_disk_bar(self, disk_percent):
+        """Return the cached 41x5 progress bar sprite for a disk usage percentage"""
+        pct = int(disk_percent)
+        sprite = self._disk_bar_cache.get(pct)
+        if sprite is None:
+            sprite = Image.new('1', (41, 5), 0)
+            bar = ImageDraw.Draw(sprite)
+            bar.rectangle([(0, 0), (pct * 40 // 100, 4)], fill=1)
+            bar.rectangle([(0, 0), (40, 4)], outline=1)
+            self._disk_bar_cache[pct] = sprite
+        return sprite
 
     def draw_network_info(self, draw, stats):
         """Draw network information"""
-        y = 18
-        
-        draw.text((66, y), "NET", font=self.small_font, fill=1)
-        y += 10
+        blit = self._blit_text
+        fmt = self.format_stat
+        image = self.image
+        y = NOTIF_H + 12  # Below the title from the page template
         
-        draw.text((66, y), f"U:{self.format_speed(stats['net_up_speed'])}", font=self.tiny_font, fill=1)
+        blit(image, fmt('net_up', stats['net_up_speed']), PANEL_X, y, 'tiny')
         y += 8
         
-        draw.text((66, y), f"D:{self.format_speed(stats['net_down_speed'])}", font=self.tiny_font, fill=1)
+        blit(image, fmt('net_down', stats['net_down_speed']), PANEL_X, y, 'tiny')
 
     def draw_processes_info(self, draw, stats):
         """Draw top processes information"""
-        y = 18
-        
-        draw.text((66, y), "PROC", font=self.small_font, fill=1)
-        y += 10
+        blit = self._blit_text
+        image = self.image
+        y = NOTIF_H + 12  # Below the title from the page template
         
-        for i, proc in enumerate(stats['top_processes'][:3]):
+        for proc in stats['top_processes'][:3]:
             name = proc['name'][:7]  # Truncate name
-            cpu = proc['cpu_percent']
-            draw.text((66, y), f"{name}:{cpu:.0f}%", font=self.tiny_font, fill=1)
+            blit(image, name + ':' + format(proc['cpu_percent'], '.0f') + '%', PANEL_X, y, 'tiny')
             y += 8
 
-    def update_display(self):
-        """Update the entire display with optimized redraws"""
-        with canvas(self.device) as draw:
-            # Get system stats (with caching)
-            stats = self.get_system_stats()
-            
-            # Draw notification bar
-            self.draw_notification_bar(draw, stats)
-            
-            # Draw dynamic GIF
-            self.draw_dynamic_gif(draw, stats)
+    def render_frame(self):
+        """Compose the framebuffer, marking only the regions that changed"""
+        now = time.monotonic()
+        stats, stats_time = self.get_system_stats()
+        fresh_stats = stats_time != self.last_rendered_stats
+        self.last_rendered_stats = stats_time
+        page_changed = self.rotate_info_page(now)
+        
+        # Draw notification bar
+        if fresh_stats:
+            self.render_region('notif', self.draw_notification_bar, stats)
+        
+        # Draw info panel
+        if fresh_stats or page_changed:
+            self.render_region('info', self.draw_info_panel, stats)
+        
+        # Draw dynamic GIF
+        self.draw_dynamic_gif(stats, fresh_stats, now)
+
+    def render_loop(self):
+        """Background thread: compose a frame at each task deadline or on new stats"""
+        while not self.stop_event.is_set():
+            with self.frame_lock:
+                self.render_frame()
+                if any(self._dirty.values()):
+                    self.frame_ready.set()
             
-            # Draw info panel
-            self.draw_info_panel(draw, stats)
+            # Sleep until the next GIF frame or page rotation is due, waking
+            # early only when the stats thread publishes a new snapshot
+            due = min(self._next.values())
+            self.stats_ready.wait(max(0, due - time.monotonic()))
+            self.stats_ready.clear()
+
+    def flush_display(self):
+        """Send every dirty region to the panel"""
+        # Snapshot under the lock so the I2C writes never block rendering
+        with self.frame_lock:
+            pending = [(name, self.region_data[name])
+                       for name, dirty in self._dirty.items() if dirty]
+            for name, _ in pending:
+                self._dirty[name] = False
+        
+        for name, data in pending:
+            self.flush_region(name, data)
+
+    def region_box(self, name):
+        """Pixel box (left, top, right, bottom) of a region in the backbuffer"""
+        col_start, col_end, page_start, page_end = self.regions[name]
+        return (col_start, page_start * 8, col_end + 1, (page_end + 1) * 8)
+
+    def render_region(self, name, painter, stats):
+        """Redraw a text region in the backbuffer and mark it dirty if its pixels changed"""
+        box = self.region_box(name)
+        self.draw.rectangle([box[:2], (box[2] - 1, box[3] - 1)], fill=0)
+        painter(self.draw, stats)
+        
+        data = self.pack_pages(self.image.crop(box))
+        if data != self.region_data[name]:
+            self.region_data[name] = data
+            self._dirty[name] = True
+
+    def flush_region(self, name, data):
+        """Push one region to the panel through a column/page window in one I2C burst"""
+        col_start, col_end, page_start, page_end = self.regions[name]
+        msg, payload = self.region_msgs[name]
+        payload[:] = data
+        self.device.command(0x21, col_start, col_end, 0x22, page_start, page_end)
+        self.i2c_bus.i2c_rdwr(msg)
 
     def run(self):
         """🚀 Run the optimized monitor!"""
@@ -448,38 +833,62 @@ class OptimizedServerMonitor:
         print("🔥 Press Ctrl+C to stop")
         print("="*60 + "\n")
         
+        # Take the first snapshot up front so the render thread has data
+        self.update_system_stats()
+        threads = [
+            threading.Thread(target=self.run_guarded, args=(self.stats_loop,), daemon=True),
+            threading.Thread(target=self.run_guarded, args=(self.render_loop,), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        
         try:
-            update_counter = 0
-            last_status_time = time.time()
+            next_status_time = time.monotonic() + 10
             
-            while True:
-                self.update_display()
-                update_counter += 1
+            while not self.stop_event.is_set():
+                # Sleep until the render thread has something to send or the
+                # next status line is due
+                timeout = max(0, next_status_time - time.monotonic())
+                if self.frame_ready.wait(timeout):
+                    self.frame_ready.clear()
+                    self.flush_display()
                 
                 # Print status every 10 seconds instead of every 100 updates
-                current_time = time.time()
-                if current_time - last_status_time >= 10:
-                    stats = self.get_system_stats()
+                current_time = time.monotonic()
+                if current_time >= next_status_time:
+                    stats, _ = self.get_system_stats()
                     print(f"📊 Usage: {self.current_usage_level.upper()} | "
                           f"CPU: {stats['cpu_percent']:5.1f}% | "
                           f"RAM: {stats['memory_percent']:5.1f}% | "
                           f"Page: {self.info_pages[self.current_info_page].upper()}")
-                    last_status_time = current_time
-                
-                # Adjust sleep time based on needs
-                time.sleep(0.1)  # Reduced from 0.05 to 0.1 for lower CPU
+                    next_status_time = current_time + 10
                 
         except KeyboardInterrupt:
             print("\n🛑 Stopping Optimized Server Monitor...")
-            
+        
+        self.stop_event.set()
+        self.stats_ready.set()
+        for thread in threads:
+            thread.join()
+        
+        if self.thread_error is None:
             # Simple goodbye message
             with canvas(self.device) as draw:
-                draw.rectangle([(0, 0), (127, 63)], fill=0)
+                draw.rectangle([(0, 0), (WIDTH - 1, HEIGHT - 1)], fill=0)
                 draw.text((35, 27), "BYE!", font=self.font, fill=1)
             
             time.sleep(1)
-            self.device.cleanup()
-            print("✅ Optimized Monitor stopped successfully!")
+        
+        self.device.cleanup()
+        self.i2c_bus.close()
+        for fd in (self.temp_fd, self.net_dev_fd, self.cpu_stat_fd, self.loadavg_fd):
+            if fd is not None:
+                os.close(fd)
+        
+        # Exit non-zero so the service manager restarts the monitor
+        if self.thread_error is not None:
+            raise RuntimeError("background thread crashed") from self.thread_error
+        print("✅ Optimized Monitor stopped successfully!")
 
 def main():
     """Main function to start the optimized monitor"""